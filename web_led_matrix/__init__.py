@@ -1,7 +1,6 @@
 from threading import Thread
 import streamlit as st
 from is_matrix_forge.led_matrix.controller.helpers import get_controllers
-import time
 
 
 class MatrixControllerApp:
@@ -13,29 +12,40 @@ class MatrixControllerApp:
     def __init__(self):
         self.controllers = get_controllers()
         self.controller_names = [c.name for c in self.controllers]
+        self._controller_by_name = {}
+        for c in self.controllers:
+            self._controller_by_name.setdefault(c.name, c)
 
         if 'processing' not in st.session_state:
             st.session_state.processing = False
         if 'identify_threads' not in st.session_state:
             st.session_state.identify_threads = []
+        if 'identify_errors' not in st.session_state:
+            st.session_state.identify_errors = []
 
-    def _identify_controller(self, controller):
-        controller.identify()
+    def _identify_controller(self, controller, errors):
+        try:
+            controller.identify()
+        except Exception as e:
+            errors.append((controller.name, e))
+            raise
 
     def handle_identify(self):
         selected = st.session_state.select_matrix
-        threads = []
+        errors = []
 
         if selected == 'All':
-            for ctrl in self.controllers:
-                t = Thread(target=self._identify_controller, args=(ctrl,), daemon=True)
-                threads.append(t)
+            targets = self.controllers
         else:
-            idx = self.controller_names.index(selected)
-            t = Thread(target=self._identify_controller, args=(self.controllers[idx],), daemon=True)
-            threads.append(t)
+            targets = [self._controller_by_name[selected]]
+
+        threads = [
+            Thread(target=self._identify_controller, args=(ctrl, errors), daemon=True)
+            for ctrl in targets
+        ]
 
         st.session_state.identify_threads = threads
+        st.session_state.identify_errors = errors
         st.session_state.processing = True
 
         for thread in threads:
@@ -43,6 +53,17 @@ class MatrixControllerApp:
 
         st.rerun()
 
+    @st.fragment(run_every=0.2)
+    def _poll_identify(self):
+        """
+        Re-run only this fragment while identification is in flight, and trigger a
+        full app rerun once every thread has finished so the controls re-enable.
+        """
+        if all(not t.is_alive() for t in st.session_state.identify_threads):
+            st.rerun()
+
+        st.info("Identifying...")
+
     def run(self):
         threads = st.session_state.identify_threads
         if threads:
@@ -65,10 +86,10 @@ class MatrixControllerApp:
             self.handle_identify()
 
         if disabled:
-            with st.spinner("Identifying..."):
-                while any(t.is_alive() for t in st.session_state.identify_threads):
-                    time.sleep(0.1)
-                st.rerun()
+            self._poll_identify()
+        else:
+            for name, error in st.session_state.identify_errors:
+                st.error(f"Identify failed on {name}: {error}")
 
 
 if __name__ == "__main__":